@@ -27,7 +27,8 @@ digraph {
 from .dot import Graph, Digraph
 from .files import Source
 from .lang import nohtml
-from .backend import (render, pipe, version, view,
+from .backend import (render, render_many, render_async, render_pool,
+                      pipe, pipe_many, pipe_to, version, view,
                       ENGINES, FORMATS, RENDERERS, FORMATTERS,
                       ExecutableNotFound, RequiredArgumentError)
 
@@ -35,7 +36,8 @@ __all__ = [
     'Graph', 'Digraph',
     'Source',
     'nohtml',
-    'render', 'pipe', 'version', 'view',
+    'render', 'render_many', 'render_async', 'render_pool',
+    'pipe', 'pipe_many', 'pipe_to', 'version', 'view',
     'ENGINES', 'FORMATS', 'RENDERERS', 'FORMATTERS',
     'ExecutableNotFound', 'RequiredArgumentError',
 ]
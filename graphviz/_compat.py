@@ -3,6 +3,7 @@
 import os
 import sys
 import operator
+import functools
 import subprocess
 
 PY2 = (sys.version_info.major == 2)
@@ -27,6 +28,48 @@ if PY2:
         if flush:
             sys.stderr.flush()
 
+    def lru_cache(maxsize=128):
+        """Minimal ``functools.lru_cache`` replacement (positional arguments only)."""
+        def decorator(func):
+            cache = {}
+
+            @functools.wraps(func)
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    pass
+                result = func(*args)
+                if maxsize is not None and len(cache) >= maxsize:
+                    cache.clear()
+                cache[args] = result
+                return result
+
+            wrapper.cache_clear = cache.clear
+            return wrapper
+        return decorator
+
+    def thread_map(func, iterable, max_workers=None):
+        """Return list of func applied to iterable items in a thread pool."""
+        import multiprocessing.pool
+
+        pool = multiprocessing.pool.ThreadPool(max_workers)
+        try:
+            return pool.map(func, iterable)
+        finally:
+            pool.close()
+            pool.join()
+
+    def replace(src, dst):
+        """Rename src to dst, overwriting dst if it exists (also on Windows)."""
+        try:
+            os.rename(src, dst)
+        except OSError:
+            if not os.path.exists(dst):
+                raise
+            os.remove(dst)
+            os.rename(src, dst)
+
     def Popen_stderr_devnull(*args, **kwargs):  # noqa: N802
         with open(os.devnull, 'w') as f:
             return subprocess.Popen(*args, stderr=f, **kwargs)
@@ -63,6 +106,20 @@ else:
         if flush:
             sys.stderr.flush()
 
+    lru_cache = functools.lru_cache
+
+    def thread_map(func, iterable, max_workers=None):
+        """Return list of func applied to iterable items in a thread pool."""
+        import concurrent.futures
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(func, iterable))
+
+    def replace(src, dst):  # allow os.replace mocking
+        return os.replace(src, dst)
+
     def Popen_stderr_devnull(*args, **kwargs):  # noqa: N802
         return subprocess.Popen(*args, stderr=subprocess.DEVNULL, **kwargs)
 
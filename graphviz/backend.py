@@ -3,7 +3,12 @@
 import os
 import re
 import errno
+import binascii
+import shutil
+import tempfile
 import logging
+import itertools
+import functools
 import platform
 import subprocess
 
@@ -12,7 +17,8 @@ from . import _compat
 from . import tools
 
 __all__ = [
-    'render', 'pipe', 'version', 'view',
+    'render', 'render_many', 'render_async', 'render_pool',
+    'pipe', 'pipe_many', 'pipe_to', 'version', 'view',
     'ENGINES', 'FORMATS', 'RENDERERS', 'FORMATTERS',
     'ExecutableNotFound', 'RequiredArgumentError',
 ]
@@ -82,6 +88,8 @@ FORMATTERS = {'cairo', 'core', 'gd', 'gdiplus', 'gdwbmp', 'xlib'}
 
 PLATFORM = platform.system().lower()
 
+VERSION_PATTERN = re.compile(r'graphviz version (\d+\.\d+(?:\.\d+)?) ')
+
 
 log = logging.getLogger(__name__)
 
@@ -109,6 +117,13 @@ class CalledProcessError(_compat.CalledProcessError):
 
 def command(engine, format_, filepath=None, renderer=None, formatter=None):
     """Return args list for ``subprocess.Popen`` and name of the rendered file."""
+    filepaths = [filepath] if filepath is not None else []
+    cmd, rendered = command_many(engine, format_, filepaths, renderer, formatter)
+    return cmd, next(iter(rendered), None)
+
+
+def command_many(engine, format_, filepaths, renderer=None, formatter=None):
+    """Return args list for ``subprocess.Popen`` and names of the rendered files."""
     if formatter is not None and renderer is None:
         raise RequiredArgumentError('formatter given without renderer')
 
@@ -123,12 +138,13 @@ def command(engine, format_, filepath=None, renderer=None, formatter=None):
 
     output_format = [f for f in (format_, renderer, formatter) if f is not None]
     cmd = [engine, '-T%s' % ':'.join(output_format)]
-    rendered = None
+    rendered = []
 
-    if filepath is not None:
-        cmd.extend(['-O', filepath])
+    if filepaths:
+        cmd.append('-O')
+        cmd.extend(filepaths)
         suffix = '.'.join(reversed(output_format))
-        rendered = '%s.%s' % (filepath, suffix)
+        rendered = ['%s.%s' % (f, suffix) for f in filepaths]
 
     return cmd, rendered
 
@@ -195,17 +211,108 @@ def render(engine, format, filepath, renderer=None, formatter=None, quiet=False)
     references to external files (e.g. ``[image=...]``) can be given as paths
     relative to the DOT source file.
     """
-    dirname, filename = os.path.split(filepath)
-    cmd, rendered = command(engine, format, filename, renderer, formatter)
-    if dirname:
-        cwd = dirname
-        rendered = os.path.join(dirname, rendered)
-    else:
-        cwd = None
-    run(cmd, capture_output=True, cwd=cwd, check=True, quiet=quiet)
+    rendered, = render_many(engine, format, [filepath], renderer, formatter, quiet)
     return rendered
 
 
+def render_many(engine, format, filepaths, renderer=None, formatter=None, quiet=False):
+    """Render files with Graphviz ``engine`` into ``format``, return result filenames.
+
+    Args:
+        engine: The layout commmand used for rendering (``'dot'``, ``'neato'``, ...).
+        format: The output format used for rendering (``'pdf'``, ``'png'``, ...).
+        filepaths: Iterable of paths to the DOT source files to render.
+        renderer: The output renderer used for rendering (``'cairo'``, ``'gd'``, ...).
+        formatter: The output formatter used for rendering (``'cairo'``, ``'gd'``, ...).
+        quiet (bool): Suppress ``stderr`` output from the layout subprocesses.
+    Returns:
+        List of the (possibly relative) paths of the rendered files (in input order).
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter`` are not known.
+        graphviz.RequiredArgumentError: If ``formatter`` is given but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz executable is not found.
+        subprocess.CalledProcessError: If the exit status is non-zero.
+
+    All files from the same directory are rendered by a single invocation of
+    the layout command, which is started from that directory (see :func:`render`).
+    A single invalid file fails the whole call, outputs of the directories
+    rendered before are left in place (their paths are not returned).
+    """
+    filepaths = list(filepaths)
+    command(engine, format, None, renderer, formatter)  # check arguments upfront
+
+    dirnames, indexes = [], {}
+    for i, filepath in enumerate(filepaths):
+        dirname = os.path.dirname(filepath)
+        if dirname not in indexes:
+            dirnames.append(dirname)
+            indexes[dirname] = []
+        indexes[dirname].append(i)
+
+    result = [None] * len(filepaths)
+    for dirname in dirnames:
+        filenames = [os.path.basename(filepaths[i]) for i in indexes[dirname]]
+        cmd, rendered = command_many(engine, format, filenames, renderer, formatter)
+        if dirname:
+            cwd = dirname
+            rendered = [os.path.join(dirname, r) for r in rendered]
+        else:
+            cwd = None
+        run(cmd, capture_output=True, cwd=cwd, check=True, quiet=quiet)
+        for i, r in zip(indexes[dirname], rendered):
+            result[i] = r
+    return result
+
+
+def render_async(engine, format, filepath, renderer=None, formatter=None, quiet=False,
+                 loop=None):
+    """Return an ``asyncio`` future of :func:`render` running in the loop's executor.
+
+    Args:
+        engine: The layout commmand used for rendering (``'dot'``, ``'neato'``, ...).
+        format: The output format used for rendering (``'pdf'``, ``'png'``, ...).
+        filepath: Path to the DOT source file to render.
+        renderer: The output renderer used for rendering (``'cairo'``, ``'gd'``, ...).
+        formatter: The output formatter used for rendering (``'cairo'``, ``'gd'``, ...).
+        quiet (bool): Suppress ``stderr`` output from the layout subprocess.
+        loop: The event loop to use (default: the running event loop).
+    Returns:
+        Awaitable ``asyncio.Future`` of the (possibly relative) path of the rendered file.
+
+    Requires Python 3. If ``loop`` is omitted, this must be called from a coroutine
+    (or callback) running in the event loop. The future raises the same exceptions
+    as :func:`render`.
+    """
+    import asyncio
+
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    func = functools.partial(render, engine, format, filepath,
+                             renderer=renderer, formatter=formatter, quiet=quiet)
+    return loop.run_in_executor(None, func)
+
+
+def render_pool(jobs, max_workers=None, quiet=False):
+    """Render files in parallel threads with :func:`render`, return result filenames.
+
+    Args:
+        jobs: Iterable of ``(engine, format, filepath[, renderer[, formatter]])`` tuples.
+        max_workers (int): Number of threads (default: number of CPUs).
+        quiet (bool): Suppress ``stderr`` output from the layout subprocesses.
+    Returns:
+        List of the (possibly relative) paths of the rendered files (in input order).
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter`` are not known.
+        graphviz.RequiredArgumentError: If ``formatter`` is given but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz executable is not found.
+        subprocess.CalledProcessError: If the exit status is non-zero.
+    """
+    def render_job(job):
+        return render(*job, quiet=quiet)
+
+    return _compat.thread_map(render_job, jobs, max_workers)
+
+
 def pipe(engine, format, data, renderer=None, formatter=None, quiet=False):
     """Return ``data`` piped through Graphviz ``engine`` into ``format``.
 
@@ -229,6 +336,111 @@ def pipe(engine, format, data, renderer=None, formatter=None, quiet=False):
     return out
 
 
+def pipe_many(engine, format, datas, renderer=None, formatter=None, quiet=False):
+    """Return ``datas`` rendered by a single Graphviz ``engine`` run into ``format``.
+
+    Args:
+        engine: The layout commmand used for rendering (``'dot'``, ``'neato'``, ...).
+        format: The output format used for rendering (``'pdf'``, ``'png'``, ...).
+        datas: Iterable of binary (encoded) DOT source strings to render.
+        renderer: The output renderer used for rendering (``'cairo'``, ``'gd'``, ...).
+        formatter: The output formatter used for rendering (``'cairo'``, ``'gd'``, ...).
+        quiet (bool): Suppress ``stderr`` output from the layout subprocess.
+    Returns:
+        List of binary (encoded) outputs of the layout command (in input order).
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter`` are not known.
+        graphviz.RequiredArgumentError: If ``formatter`` is given but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz executable is not found.
+        subprocess.CalledProcessError: If the exit status is non-zero.
+
+    The sources are written to a temporary directory and rendered by a single
+    invocation of the layout command, so a single invalid source fails the whole
+    call. As with :func:`pipe`, the command is started from the current working
+    directory (relative paths inside the sources are resolved from there).
+    If a source contains multiple graphs, their outputs are concatenated (for
+    paged formats such as ``'ps'`` this gives one document per graph, unlike
+    :func:`pipe`, which puts them into one document).
+    """
+    command(engine, format, None, renderer, formatter)  # check arguments upfront
+
+    tmpdir = tempfile.mkdtemp(prefix='graphviz-')
+    try:
+        filepaths = []
+        for i, data in enumerate(datas):
+            filepath = os.path.join(tmpdir, '%d.gv' % i)
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            filepaths.append(filepath)
+
+        result = []
+        if filepaths:
+            cmd, rendered = command_many(engine, format, filepaths, renderer, formatter)
+            run(cmd, capture_output=True, check=True, quiet=quiet)
+            for filepath, r in zip(filepaths, rendered):
+                result.append(b''.join(_read_outputs(filepath, r)))
+        return result
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def _read_outputs(filepath, rendered):
+    """Yield the contents of all files written by ``-O`` for the graphs in ``filepath``."""
+    suffix = rendered[len(filepath):]
+    with open(rendered, 'rb') as f:
+        yield f.read()
+    for i in itertools.count(2):  # 0.gv.svg, 0.gv.2.svg, 0.gv.3.svg, ...
+        try:
+            f = open('%s.%d%s' % (filepath, i, suffix), 'rb')
+        except IOError as e:
+            if e.errno == errno.ENOENT:
+                return
+            raise
+        with f:
+            yield f.read()
+
+
+def pipe_to(engine, format, data, filepath, renderer=None, formatter=None, quiet=False):
+    """Write ``data`` piped through Graphviz ``engine`` into ``format`` to ``filepath``.
+
+    Args:
+        engine: The layout commmand used for rendering (``'dot'``, ``'neato'``, ...).
+        format: The output format used for rendering (``'pdf'``, ``'png'``, ...).
+        data: The binary (encoded) DOT source string to render.
+        filepath: Path of the file to write the stdout of the layout command to.
+        renderer: The output renderer used for rendering (``'cairo'``, ``'gd'``, ...).
+        formatter: The output formatter used for rendering (``'cairo'``, ``'gd'``, ...).
+        quiet (bool): Suppress ``stderr`` output from the layout subprocess.
+    Returns:
+        The (possibly relative) path of the written file.
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter`` are not known.
+        graphviz.RequiredArgumentError: If ``formatter`` is given but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz executable is not found.
+        subprocess.CalledProcessError: If the exit status is non-zero.
+
+    The output goes directly from the layout subprocess into a temporary file
+    next to ``filepath`` (it is not held in memory as with :func:`pipe`), which
+    only replaces ``filepath`` if the layout command succeeds.
+    """
+    cmd, _ = command(engine, format, None, renderer, formatter)
+    suffix = binascii.hexlify(os.urandom(4)).decode('ascii')
+    tmppath = '%s.%s.tmp' % (filepath, suffix)
+    fd = os.open(tmppath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    replaced = False
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            run(cmd, input=data, stdout=f, stderr=subprocess.PIPE,
+                check=True, quiet=quiet)
+        _compat.replace(tmppath, filepath)
+        replaced = True
+    finally:
+        if not replaced:
+            os.remove(tmppath)
+    return filepath
+
+
+@_compat.lru_cache(maxsize=1)
 def version():
     """Return the version number tuple from the ``stderr`` output of ``dot -V``.
 
@@ -238,6 +450,9 @@ def version():
         graphviz.ExecutableNotFound: If the Graphviz executable is not found.
         subprocess.CalledProcessError: If the exit status is non-zero.
         RuntimmeError: If the output cannot be parsed into a version number.
+
+    The result is cached, use ``version.cache_clear()`` to run ``dot -V`` again
+    (e.g. after changing the ``PATH``).
     """
     cmd = ['dot', '-V']
     out, _ = run(cmd, check=True,
@@ -245,7 +460,7 @@ def version():
                  stderr=subprocess.STDOUT)
 
     info = out.decode('ascii')
-    ma = re.search(r'graphviz version (\d+\.\d+(?:\.\d+)?) ', info)
+    ma = VERSION_PATTERN.search(info)
     if ma is None:
         raise RuntimeError('cannot parse %r output: %r' % (cmd, info))
     return tuple(int(d) for d in ma.group(1).split('.'))
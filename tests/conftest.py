@@ -5,6 +5,10 @@ import platform as platform_
 
 import pytest
 
+import graphviz.backend
+
+collect_ignore = ['test_backend_async.py'] if sys.version_info.major == 2 else []
+
 
 def pytest_addoption(parser):
     parser.addoption('--skipexe', action='store_true',
@@ -48,7 +52,9 @@ def unknown_platform(monkeypatch, name='nonplatform'):
 
 @pytest.fixture
 def Popen(mocker):  # noqa: N802
+    graphviz.backend.version.cache_clear()
     yield mocker.patch('subprocess.Popen', autospec=True)
+    graphviz.backend.version.cache_clear()
 
 
 @pytest.fixture
@@ -63,6 +69,7 @@ def startfile(mocker, test_platform):
 @pytest.fixture
 def empty_path(monkeypatch):
     monkeypatch.setenv('PATH', '')
+    graphviz.backend.version.cache_clear()
 
 
 @pytest.fixture(params=[False, True], ids=lambda q: 'quiet=%r' % q)
@@ -8,7 +8,8 @@ import subprocess
 
 import pytest
 
-from graphviz.backend import (run, render, pipe, version, view,
+from graphviz.backend import (run, render, render_many, render_pool,
+                              pipe, pipe_many, pipe_to, version, view,
                               ExecutableNotFound, RequiredArgumentError)
 
 
@@ -126,6 +127,121 @@ def test_render_mocked(capsys, mocker, Popen, quiet):  # noqa: N803
     assert capsys.readouterr() == ('', '' if quiet else 'stderr')
 
 
+def test_render_many_format_unknown():
+    with pytest.raises(ValueError, match=r'unknown format'):
+        render_many('dot', '', [])
+
+
+@pytest.exe
+def test_render_many(capsys, tmpdir, engine='dot', format_='pdf',
+                     filenames=('spam.gv', 'eggs.gv', 'subdir/ham.gv'),
+                     data=b'digraph { hello -> world }'):
+    lpaths = [tmpdir.join(f) for f in filenames]
+    for lpath in lpaths:
+        lpath.write_binary(data, ensure=True)
+    rendered = [p.new(ext='%s.%s' % (p.ext, format_)) for p in lpaths]
+
+    assert render_many(engine, format_, map(str, lpaths)) == list(map(str, rendered))
+
+    assert all(r.size() for r in rendered)
+    assert capsys.readouterr() == ('', '')
+
+
+@pytest.mark.parametrize('filepaths', [
+    ['spam'],
+    ['spam', 'eggs', 'ham'],
+])
+def test_render_many_mocked(capsys, mocker, Popen, quiet, filepaths):  # noqa: N803
+    proc = Popen.return_value
+    proc.returncode = 0
+    proc.communicate.return_value = (b'stdout', b'stderr')
+
+    result = render_many('dot', 'pdf', iter(filepaths), quiet=quiet)
+
+    assert result == [f + '.pdf' for f in filepaths]
+    Popen.assert_called_once_with(['dot', '-Tpdf', '-O'] + filepaths,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE,
+                                  cwd=None, startupinfo=mocker.ANY)
+    check_startupinfo(Popen)
+    proc.communicate.assert_called_once_with(None)
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_render_many_dirs_mocked(mocker, Popen):  # noqa: N803
+    proc = Popen.return_value
+    proc.returncode = 0
+    proc.communicate.return_value = (b'', b'')
+    filepaths = ['spam', os.path.join('sub', 'eggs'), 'ham']
+
+    result = render_many('dot', 'svg', filepaths)
+
+    assert result == [f + '.svg' for f in filepaths]
+    assert Popen.call_args_list == [
+        mocker.call(['dot', '-Tsvg', '-O', 'spam', 'ham'],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    cwd=None, startupinfo=mocker.ANY),
+        mocker.call(['dot', '-Tsvg', '-O', 'eggs'],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    cwd='sub', startupinfo=mocker.ANY),
+    ]
+
+
+def test_render_many_dirs_fail_mocked(mocker, Popen):  # noqa: N803
+    procs = [mocker.Mock(returncode=returncode, **{'communicate.return_value': (b'', b'')})
+             for returncode in (0, 1)]
+    Popen.side_effect = procs
+    filepaths = ['spam', os.path.join('sub', 'eggs')]
+
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        render_many('dot', 'svg', filepaths, quiet=True)
+
+    assert e.value.returncode == 1
+    assert e.value.cmd == ['dot', '-Tsvg', '-O', 'eggs']
+    assert Popen.call_count == 2
+    for proc in procs:
+        proc.communicate.assert_called_once_with(None)
+
+
+@pytest.exe
+def test_render_pool(capsys, tmpdir, data=b'digraph { hello -> world }'):
+    filenames = ['spam.gv', 'eggs.gv', 'ham.gv']
+    lpaths = [tmpdir / f for f in filenames]
+    for lpath in lpaths:
+        lpath.write_binary(data)
+    jobs = [('dot', 'pdf', str(lpaths[0])),
+            ('neato', 'svg', str(lpaths[1])),
+            ('dot', 'plain', str(lpaths[2]), 'dot', 'core')]
+    expected = [str(tmpdir / r) for r in ('spam.gv.pdf', 'eggs.gv.svg',
+                                          'ham.gv.core.dot.plain')]
+
+    assert render_pool(jobs, max_workers=2) == expected
+
+    assert all(os.path.getsize(r) for r in expected)
+    assert capsys.readouterr() == ('', '')
+
+
+def test_render_pool_mocked(render, quiet):
+    render.side_effect = lambda *args, **kwargs: args[2] + '.rendered'
+    jobs = [('dot', 'pdf', 'spam'), ('neato', 'ps', 'eggs', 'ps', 'core')]
+
+    assert render_pool(iter(jobs), quiet=quiet) == ['spam.rendered', 'eggs.rendered']
+
+    assert render.call_count == 2
+    render.assert_any_call('dot', 'pdf', 'spam', quiet=quiet)
+    render.assert_any_call('neato', 'ps', 'eggs', 'ps', 'core', quiet=quiet)
+
+
+def test_render_pool_no_sem_open_mocked(mocker, py2, render):
+    if py2:
+        pytest.skip('Python 2 falls back to multiprocessing.pool.ThreadPool')
+    mocker.patch('multiprocessing.pool.ThreadPool', autospec=True,
+                 side_effect=OSError(38, 'Function not implemented'))
+    render.side_effect = lambda *args, **kwargs: args[2] + '.rendered'
+
+    assert render_pool([('dot', 'pdf', 'spam')], max_workers=1) == ['spam.rendered']
+
+
 @pytest.mark.usefixtures('empty_path')
 def test_pipe_missing_executable():
     with pytest.raises(ExecutableNotFound, match=r'execute'):
@@ -212,6 +328,137 @@ def test_pipe_mocked(capsys, mocker, Popen, quiet):  # noqa: N803
     assert capsys.readouterr() == ('', '' if quiet else 'stderr')
 
 
+@pytest.exe
+@pytest.mark.parametrize('format_, renderer, formatter, pattern', [
+    ('svg', None, None, r'(?s)^<\?xml .+</svg>\s*$'),
+    ('ps', 'ps', 'core', r'%!PS-'),
+])
+@pytest.mark.parametrize('engine', ['dot'])
+def test_pipe_many(capsys, engine, format_, renderer, formatter, pattern,
+                   datas=(b'graph { spam }', b'digraph { eggs -> ham }')):
+    result = pipe_many(engine, format_, datas, renderer, formatter)
+
+    assert len(result) == len(datas)
+    for out, name in zip(result, ['spam', 'eggs']):
+        out = out.decode('ascii')
+        assert re.match(pattern, out)
+        assert name in out
+    assert capsys.readouterr() == ('', '')
+
+
+def test_pipe_many_mocked(capsys, mocker, Popen, quiet):  # noqa: N803
+    def write_rendered(cmd, **kwargs):
+        for f in cmd[cmd.index('-O') + 1:]:
+            with open(f, 'rb') as src, open(f + '.svg', 'wb') as dst:
+                dst.write(src.read().upper())
+        return mocker.DEFAULT
+
+    Popen.side_effect = write_rendered
+    proc = Popen.return_value
+    proc.returncode = 0
+    proc.communicate.return_value = (b'stdout', b'stderr')
+
+    assert pipe_many('dot', 'svg', iter([b'spam', b'eggs']), quiet=quiet) == [b'SPAM', b'EGGS']
+
+    Popen.assert_called_once_with(mocker.ANY,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE,
+                                  startupinfo=mocker.ANY)
+    check_startupinfo(Popen)
+    cmd = Popen.call_args[0][0]
+    assert cmd[:3] == ['dot', '-Tsvg', '-O']
+    assert all(os.path.isabs(f) for f in cmd[3:])
+    assert [os.path.basename(f) for f in cmd[3:]] == ['0.gv', '1.gv']
+    assert not os.path.exists(os.path.dirname(cmd[3]))
+    proc.communicate.assert_called_once_with(None)
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_pipe_many_multiple_graphs_mocked(mocker, Popen):  # noqa: N803
+    def write_rendered(cmd, **kwargs):
+        spam, eggs = cmd[cmd.index('-O') + 1:]
+        for name, data in [(spam + '.svg', b'SPAM1'), (spam + '.2.svg', b'SPAM2'),
+                           (spam + '.3.svg', b'SPAM3'), (eggs + '.svg', b'EGGS')]:
+            with open(name, 'wb') as f:
+                f.write(data)
+        return mocker.DEFAULT
+
+    Popen.side_effect = write_rendered
+    proc = Popen.return_value
+    proc.returncode = 0
+    proc.communicate.return_value = (b'', b'')
+
+    assert pipe_many('dot', 'svg', [b'spam', b'eggs']) == [b'SPAM1SPAM2SPAM3', b'EGGS']
+
+    Popen.assert_called_once_with(mocker.ANY,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE,
+                                  startupinfo=mocker.ANY)
+
+
+@pytest.exe
+@pytest.mark.parametrize('format_', ['svg', 'ps'])
+def test_pipe_to(capsys, tmpdir, format_, engine='dot', data=b'graph { spam }'):
+    lpath = tmpdir / ('spam.%s' % format_)
+
+    assert pipe_to(engine, format_, data, str(lpath)) == str(lpath)
+
+    assert lpath.read_binary() == pipe(engine, format_, data)
+    assert capsys.readouterr() == ('', '')
+
+
+def test_pipe_to_mocked(capsys, mocker, tmpdir, Popen, quiet):  # noqa: N803
+    lpath = tmpdir / 'nonfile'
+    proc = Popen.return_value
+    proc.returncode = 0
+    proc.communicate.return_value = (None, b'stderr')
+
+    assert pipe_to('dot', 'png', b'nongraph', str(lpath), quiet=quiet) == str(lpath)
+
+    Popen.assert_called_once_with(['dot', '-Tpng'],
+                                  stdin=subprocess.PIPE,
+                                  stdout=mocker.ANY,
+                                  stderr=subprocess.PIPE,
+                                  startupinfo=mocker.ANY)
+    check_startupinfo(Popen)
+    assert Popen.call_args[1]['stdout'].closed
+    proc.communicate.assert_called_once_with(b'nongraph')
+    assert tmpdir.listdir() == [lpath]
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_pipe_to_fail_mocked(tmpdir, Popen):  # noqa: N803
+    lpath = tmpdir / 'nonfile'
+    lpath.write_binary(b'spam')
+    proc = Popen.return_value
+    proc.returncode = 1
+    proc.communicate.return_value = (None, b'stderr')
+
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        pipe_to('dot', 'png', b'nongraph', str(lpath), quiet=True)
+
+    assert e.value.returncode == 1
+    proc.communicate.assert_called_once_with(b'nongraph')
+    assert tmpdir.listdir() == [lpath]
+    assert lpath.read_binary() == b'spam'
+
+    proc.communicate.side_effect = KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        pipe_to('dot', 'png', b'nongraph', str(lpath), quiet=True)
+
+    assert tmpdir.listdir() == [lpath]
+    assert lpath.read_binary() == b'spam'
+
+
+@pytest.mark.usefixtures('empty_path')
+def test_pipe_to_missing_executable(tmpdir):
+    with pytest.raises(ExecutableNotFound, match=r'execute'):
+        pipe_to('dot', 'pdf', b'nongraph', str(tmpdir / 'nonfile'))
+
+    assert tmpdir.listdir() == []
+
+
 @pytest.mark.usefixtures('empty_path')
 def test_version_missing_executable():
     with pytest.raises(ExecutableNotFound, match=r'execute'):
@@ -258,6 +505,22 @@ def test_version_mocked(mocker, Popen):  # noqa: N803
     proc.communicate.assert_called_once_with(None)
 
 
+def test_version_cached(Popen):  # noqa: N803
+    proc = Popen.return_value
+    proc.returncode = 0
+    proc.communicate.return_value = (b'dot - graphviz version 1.2.3 (mocked)',
+                                     None)
+
+    assert version() == version() == (1, 2, 3)
+
+    assert Popen.call_count == 1
+
+    version.cache_clear()
+    assert version() == (1, 2, 3)
+
+    assert Popen.call_count == 2
+
+
 def test_view_unknown_platform(unknown_platform):
     with pytest.raises(RuntimeError, match=r'platform'):
         view('nonfilepath')
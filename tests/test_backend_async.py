@@ -0,0 +1,51 @@
+# test_backend_async.py - Python 3 only (see conftest.py)
+
+import os
+import asyncio
+
+import pytest
+
+from graphviz.backend import render_async
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.exe
+def test_render_async(loop, tmpdir, engine='dot', format_='pdf', n=64,
+                      data=b'digraph { hello -> world }'):
+    lpaths = [tmpdir / ('%d.gv' % i) for i in range(n)]
+    for lpath in lpaths:
+        lpath.write_binary(data)
+
+    async def render_all():
+        return await asyncio.gather(*[render_async(engine, format_, str(p))
+                                      for p in lpaths])
+
+    result = loop.run_until_complete(render_all())
+
+    assert result == ['%s.%s' % (p, format_) for p in lpaths]
+    assert all(os.path.getsize(r) for r in result)
+
+
+def test_render_async_mocked(loop, render):
+    future = render_async('dot', 'pdf', 'nonfilepath', loop=loop)
+
+    assert loop.run_until_complete(future) is render.return_value
+
+    render.assert_called_once_with('dot', 'pdf', 'nonfilepath',
+                                   renderer=None, formatter=None, quiet=False)
+
+
+def test_render_async_running_loop_mocked(loop, render):
+    async def coroutine():
+        return await render_async('dot', 'pdf', 'nonfilepath', quiet=True)
+
+    assert loop.run_until_complete(coroutine()) is render.return_value
+
+    render.assert_called_once_with('dot', 'pdf', 'nonfilepath',
+                                   renderer=None, formatter=None, quiet=True)